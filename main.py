@@ -1,8 +1,10 @@
 # // FILE: main.py
 import sys
-import platform
+import atexit
+import queue
 
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
 # TODO: Verify if this fallback actually works on user machines without crashing immediately
 try:
@@ -13,16 +15,22 @@ except ImportError:
     print("CRITICAL: PySide6 is not installed. Please run 'pip install -r requirements.txt'")
     sys.exit(1)
 
-from qt_gui import MainWindow
-
 # NOTE: Logging config is basic for now, maybe add rotating file handler later?
+# Callers (including the Qt main loop) only enqueue records; the listener thread does the actual file/console writes.
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(
+    _log_queue,
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler("gamebeam.log", mode='w', encoding='utf-8'),
+    respect_handler_level=True,
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # flushes whatever is still queued
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("gamebeam.log", mode='w', encoding='utf-8')
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
@@ -37,6 +45,9 @@ def main():
     app.setOrganizationName("GameBeam")
     # NOTE: Qt6 handles HighDPI mostly automatically now, so explicit attribute setting removed.
 
+    # NOTE: Imported late so the QApplication exists before the whole GUI/backend import graph is pulled in.
+    from qt_gui import MainWindow
+
     window = MainWindow()
     window.show()
 
@@ -1,16 +1,39 @@
 # // FILE: moonlight.py
 import os
-import requests
+import re
 import zipfile
 import threading
 import subprocess
 import logging
+from utils import fetch_release, download_to_buffer, extract_zip, find_extracted
 
 logger = logging.getLogger(__name__)
 
+# Fire-and-forget launches: don't tie Moonlight to our console or process group.
+if os.name == "nt":
+    DETACHED_FLAGS = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+else:
+    DETACHED_FLAGS = 0
+
+# Portable asset naming: prefer the x64 build, otherwise settle for any portable zip
+_ASSET_PREFERRED_RE = re.compile(r"portable.*x64.*\.zip$|x64.*portable.*\.zip$", re.I)
+_ASSET_FALLBACK_RE = re.compile(r"portable.*\.zip$", re.I)
+
 # NOTE: Handling the client-side installer logic here. 
 # Ideally we'd package this, but downloading on the fly keeps the initial footprint small.
 
+def _spawn_detached(cmd):
+    """Starts `cmd` without inheriting our stdio handles; we never look at the child again."""
+    subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+        creationflags=DETACHED_FLAGS,
+    )
+
+
 class MoonlightInstaller:
     """
     # TODO: Add checksum verification if we get serious about security.
@@ -23,27 +46,24 @@ class MoonlightInstaller:
         try:
             if progress_callback: progress_callback("Checking Moonlight release...", 10)
             
-            resp = requests.get(MoonlightInstaller.GITHUB_API_URL, timeout=10)
-            if resp.status_code != 200:
-                raise Exception(f"GitHub API Failed: {resp.status_code}")
-            
-            data = resp.json()
+            data = fetch_release(MoonlightInstaller.GITHUB_API_URL)
             assets = data.get("assets", [])
             download_url = None
             
-            # FIXME: This search loop is fragile. If they change the portable zip naming scheme, we are cooked.
+            # Single pass: score every asset and keep the first best match
+            best_score = 0
             for asset in assets:
-                name = asset["name"].lower()
-                if "portable" in name and "x64" in name and name.endswith(".zip"):
+                name = asset["name"]
+                if _ASSET_PREFERRED_RE.search(name):
+                    score = 2
+                elif _ASSET_FALLBACK_RE.search(name):
+                    score = 1
+                else:
+                    continue
+                if score > best_score:
+                    best_score = score
                     download_url = asset["browser_download_url"]
-                    break
-            
-            if not download_url:
-                 # Fallback to just finding any zip if the specific x64 portable naming fails
-                for asset in assets:
-                     name = asset["name"].lower()
-                     if "portable" in name and name.endswith(".zip"):
-                        download_url = asset["browser_download_url"]
+                    if score == 2:
                         break
             
             if not download_url:
@@ -54,36 +74,14 @@ class MoonlightInstaller:
             if not os.path.exists(target_dir):
                 os.makedirs(target_dir)
                 
-            local_zip = os.path.join(target_dir, "moonlight.zip")
-            
-            with requests.get(download_url, stream=True) as r:
-                r.raise_for_status()
-                total_length = r.headers.get('content-length')
-                dl = 0
-                with open(local_zip, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192): 
-                        if chunk: 
-                            dl += len(chunk)
-                            f.write(chunk)
-                            if total_length and progress_callback:
-                                percent = 30 + int((dl / int(total_length)) * 40)
-                                progress_callback("Downloading...", percent)
-
-            if progress_callback: progress_callback("Extracting...", 80)
-            
-            with zipfile.ZipFile(local_zip, 'r') as zip_ref:
-                zip_ref.extractall(target_dir)
-            
-            try:
-                os.remove(local_zip)
-            except: pass
-            
-            # TODO: Improve this. Walking the whole dir is slow if the zip is huge (it shouldn't be).
-            exe_path = None
-            for root, dirs, files in os.walk(target_dir):
-                if "Moonlight.exe" in files:
-                    exe_path = os.path.join(root, "Moonlight.exe")
-                    break
+            # Downloaded into memory or a temp file, so there's no moonlight.zip to write, re-read and delete
+            with download_to_buffer(download_url, progress_callback) as buf:
+                if progress_callback: progress_callback("Extracting...", 80)
+
+                with zipfile.ZipFile(buf, 'r') as zip_ref:
+                    members = extract_zip(zip_ref, target_dir, progress_callback)
+
+            exe_path = find_extracted(members, "moonlight.exe")
             
             if progress_callback: progress_callback("Done!", 100)
             return True, exe_path
@@ -107,26 +105,44 @@ class MoonlightInstaller:
 # Moonlight Runner
 # =========================
 
+# First DEFAULT_PATHS hit, shared by every MoonlightRunner so rebuilding the runner doesn't re-probe the disk.
+# Misses aren't cached, so a Moonlight installed mid-session still gets picked up.
+_CACHED_MOONLIGHT = None
+
+
+def invalidate_moonlight_cache():
+    """Forget the cached default Moonlight location (after the user browses to or installs a new one)."""
+    global _CACHED_MOONLIGHT
+    _CACHED_MOONLIGHT = None
+
+
 class MoonlightRunner:
-    DEFAULT_PATHS = [
+    DEFAULT_PATHS = (
         r"C:\Program Files\Moonlight Game Streaming\Moonlight.exe",
         r"C:\Program Files (x86)\Moonlight Game Streaming\Moonlight.exe",
         os.path.expanduser(r"~\AppData\Local\Moonlight Game Streaming\Moonlight.exe")
-    ]
+    )
 
     def __init__(self, exe_path=None):
         self.exe_path = exe_path or self._find_moonlight()
     
     def _find_moonlight(self):
+        global _CACHED_MOONLIGHT
+        if _CACHED_MOONLIGHT:
+            return _CACHED_MOONLIGHT
+
         # NOTE: Just checking the usual suspects. Users can override this in settings.
         for path in self.DEFAULT_PATHS:
-            if os.path.exists(path):
+            # os.access is a single syscall and also rules out non-executable hits
+            if os.access(path, os.X_OK):
                 logger.info(f"Found Moonlight at: {path}")
+                _CACHED_MOONLIGHT = path
                 return path
         return None
 
     def launch(self, host_ip, width=1920, height=1080, fps=60, bitrate=20000, vsync=True, app_name="Desktop"):
-        if not self.exe_path or not os.path.exists(self.exe_path):
+        # NOTE: No re-stat here. The path was resolved up front; if it vanished since, Popen raises FileNotFoundError.
+        if not self.exe_path:
             logger.error("Moonlight executable not found.")
             return False, "Moonlight.exe not found. Please set path."
 
@@ -147,24 +163,31 @@ class MoonlightRunner:
         else:
             cmd.append("--no-vsync")
 
-        logger.info(f"Launching Moonlight: {' '.join(cmd)}")
+        # Only build the display string if INFO is actually going somewhere
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Launching Moonlight: %s", subprocess.list2cmdline(cmd))
         
         try:
             # Fire and forget. We don't need to hold the handle.
-            subprocess.Popen(cmd)
+            _spawn_detached(cmd)
             return True, "Moonlight Launched"
+        except FileNotFoundError:
+            logger.error(f"Moonlight executable not found: {self.exe_path}")
+            return False, "Moonlight.exe not found. Please set path."
         except Exception as e:
             logger.error(f"Failed to launch Moonlight: {e}")
             return False, str(e)
 
     def open_gui(self):
         """Launches Moonlight GUI for pairing."""
-        if not self.exe_path or not os.path.exists(self.exe_path):
+        if not self.exe_path:
              return False, "Moonlight.exe not found."
         
         try:
             logger.info("Opening Moonlight GUI...")
-            subprocess.Popen([self.exe_path])
+            _spawn_detached([self.exe_path])
             return True, "Moonlight GUI Opened"
+        except FileNotFoundError:
+            return False, "Moonlight.exe not found."
         except Exception as e:
             return False, str(e)
@@ -1,8 +1,9 @@
 # // FILE: qt_gui.py
 import os
+import time
 import platform
 
-from PySide6.QtCore import Qt, QTimer, QThread, Signal, Slot
+from PySide6.QtCore import Qt, QTimer, QThread, QObject, QRunnable, QThreadPool, Signal, Slot
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -25,11 +26,27 @@ import logging
 logger = logging.getLogger(__name__)
 from utils import get_local_ip, encode_connection_code, decode_connection_code
 from sunshine import SunshineManager, SunshineInstaller, SunshineAPI
-from moonlight import MoonlightInstaller, MoonlightRunner
+from moonlight import MoonlightInstaller, MoonlightRunner, invalidate_moonlight_cache
 
 
 CONFIG_FILE = "gb_config.txt"
 
+# Shared fonts / label styles so every screen reuses the same objects instead of building its own.
+# NOTE: QFont needs the QApplication to exist, main.py only imports this module after creating it.
+_FONT_TITLE = QFont("Segoe UI", 22, QFont.Bold)
+_FONT_HEADING = QFont("Segoe UI", 18, QFont.Bold)
+_FONT_SECTION = QFont("Segoe UI", 14, QFont.Bold)
+_FONT_CARD = QFont("Segoe UI", 12, QFont.Bold)
+_FONT_BODY = QFont("Segoe UI", 12)
+_FONT_SMALL_BOLD = QFont("Segoe UI", 11, QFont.Bold)
+_FONT_SMALL = QFont("Segoe UI", 11)
+
+_STYLE_OK = "color: #2cc985;"
+_STYLE_ERROR = "color: #ff6666;"
+_STYLE_PATH = "color: #bbbbbb;"
+_STYLE_MUTED = "color: #aaaaaa;"
+_STYLE_WHITE = "color: white;"
+
 
 # =========================
 # Helpers: config load/save
@@ -41,10 +58,9 @@ def load_config():
     if os.path.exists(CONFIG_FILE):
         try:
             with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                for line in f:
-                    if "=" in line:
-                        k, v = line.strip().split("=", 1)
-                        cfg[k] = v.strip()
+                text = f.read()
+            pairs = (line.strip().split("=", 1) for line in text.splitlines() if "=" in line)
+            cfg = {k: v.strip() for k, v in pairs}
         except Exception as e:
             logger.warning(f"Failed to load config: {e}")
     return cfg
@@ -52,9 +68,13 @@ def load_config():
 
 def save_config(cfg):
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            for k, v in cfg.items():
-                f.write(f"{k}={v}\n")
+        text = "".join(f"{k}={v}\n" for k, v in cfg.items())
+        # Write next to the real file and swap it in, so a crash mid-write never leaves a truncated config
+        tmp = CONFIG_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+        os.replace(tmp, CONFIG_FILE)
     except Exception as e:
         logger.warning(f"Failed to save config: {e}")
 
@@ -63,29 +83,71 @@ def save_config(cfg):
 # Threads / Workers
 # =========================
 
-class SunshineStatusWorker(QThread):
+class StatusPoller(QObject):
+    """
+    Long-lived Sunshine status checker. Lives on its own QThread for the whole session
+    and gets poked by MainWindow's status timer, so polling never spawns threads.
+    """
     result = Signal(bool)
 
+    def __init__(self):
+        super().__init__()
+        # Set by MainWindow when it queues a poll, cleared here once the poll has reported
+        self.in_flight = False
+
+    @Slot()
+    def poll(self):
+        try:
+            running = SunshineManager.is_running()
+            self.result.emit(running)
+        finally:
+            self.in_flight = False
+
+
+class IpWorker(QThread):
+    result = Signal(str)
+
     def run(self):
-        running = SunshineManager.is_running()
-        self.result.emit(running)
+        # NOTE: The UDP connect trick can stall for a while with no network, keep it off the GUI thread.
+        self.result.emit(get_local_ip())
 
 
-class InstallWorker(QThread):
+# NOTE: One-shot jobs run on QThreadPool.globalInstance() so threads get reused.
+# QRunnable can't carry signals, so each job reports through a small QObject owned by the caller.
+
+class InstallSignals(QObject):
     progress = Signal(str, int)      # text, percent
     finished = Signal(bool, str)     # success, path_or_error
 
-    def __init__(self, installer_cls, target_dir, parent=None):
-        super().__init__(parent)
+
+class InstallJob(QRunnable):
+    # Minimum gap between two progress emits for the same step
+    PROGRESS_INTERVAL = 0.05
+
+    def __init__(self, installer_cls, target_dir, signals: InstallSignals):
+        super().__init__()
+        self.signals = signals
         self.installer_cls = installer_cls
         self.target_dir = target_dir
+        self._last_text = None
+        self._last_pct = -1
+        self._last_t = 0.0
 
     def run(self):
         def cb(text, percent):
-            self.progress.emit(text, percent)
+            # Coalesce: every emit is a queued event + progress bar repaint on the GUI thread.
+            # Step changes and the final 100% always go through.
+            now = time.monotonic()
+            if text == self._last_text and percent < 100:
+                if percent == self._last_pct or now - self._last_t < self.PROGRESS_INTERVAL:
+                    return
+            self._last_text = text
+            self._last_pct = percent
+            self._last_t = now
+            self.signals.progress.emit(text, percent)
 
         success, res = self.installer_cls.install(self.target_dir, cb)
-        self.finished.emit(success, res)
+        self.signals.finished.emit(success, res)
 
 
 # =========================
@@ -98,18 +160,22 @@ class HostScreen(QWidget):
     # TODO: This screen is getting crowded. Consider splitting status and actions into tabs.
     """
 
-    def __init__(self, parent, sunshine_api: SunshineAPI):
+    def __init__(self, parent, sunshine_api: SunshineAPI, ip: str | None = None, code: str | None = None):
         super().__init__(parent)
         self.sunshine_api = sunshine_api
         self._build_ui()
 
+        # MainWindow hands down its cached IP/code when it already has them
+        if ip:
+            self.set_local_ip(ip, code)
+
     def _build_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(16)
 
         title = QLabel("Host (Sunshine)")
-        title.setFont(QFont("Segoe UI", 22, QFont.Bold))
+        title.setFont(_FONT_TITLE)
         layout.addWidget(title)
 
         # Status Card
@@ -119,7 +185,7 @@ class HostScreen(QWidget):
         status_layout.setContentsMargins(16, 16, 16, 16)
 
         self.lbl_status = QLabel("Checking Sunshine status...")
-        self.lbl_status.setFont(QFont("Segoe UI", 12))
+        self.lbl_status.setFont(_FONT_BODY)
         status_layout.addWidget(self.lbl_status)
 
         self.btn_status_action = QPushButton("...")
@@ -135,8 +201,8 @@ class HostScreen(QWidget):
         ip_layout.setContentsMargins(16, 16, 16, 16)
         ip_layout.setSpacing(12)
 
-        self.lbl_ip = QLabel()
-        self.lbl_ip.setFont(QFont("Segoe UI", 11))
+        self.lbl_ip = QLabel("LAN IP: detecting…")
+        self.lbl_ip.setFont(_FONT_SMALL)
         ip_layout.addWidget(self.lbl_ip)
 
         row_code = QHBoxLayout()
@@ -169,15 +235,15 @@ class HostScreen(QWidget):
 
         layout.addStretch()
 
-        # Prepare IP + code
-        ip = get_local_ip()
-        self.lbl_ip.setText(f"LAN IP: <b>{ip}</b>")
-        code = encode_connection_code(ip)
-        self.edit_code.setText(code)
-
         # Default status
         self.update_status(False)
 
+    @Slot(str, str)
+    def set_local_ip(self, ip: str, code: str | None = None):
+        """Fill in the IP + connection code once MainWindow has resolved the LAN IP."""
+        self.lbl_ip.setText(f"LAN IP: <b>{ip}</b>")
+        self.edit_code.setText(code or encode_connection_code(ip))
+
     def update_status(self, running: bool):
         # Safely disconnect any previous connections
         # FIXME: This disconnect logic is a bit brute-force. Need a cleaner signal management later.
@@ -188,12 +254,12 @@ class HostScreen(QWidget):
 
         if running:
             self.lbl_status.setText("● Sunshine Web UI is reachable on https://localhost:47990")
-            self.lbl_status.setStyleSheet("color: #2cc985;")
+            self.lbl_status.setStyleSheet(_STYLE_OK)
             self.btn_status_action.setText("Open Sunshine Web UI")
             self.btn_status_action.clicked.connect(self.open_web_ui)
         else:
             self.lbl_status.setText("● Sunshine not detected (service not running)")
-            self.lbl_status.setStyleSheet("color: #ff6666;")
+            self.lbl_status.setStyleSheet(_STYLE_ERROR)
             self.btn_status_action.setText("Start Sunshine")
             self.btn_status_action.clicked.connect(self.start_sunshine)
 
@@ -243,25 +309,23 @@ class ClientScreen(QWidget):
         layout.setSpacing(16)
 
         title = QLabel("Client (Moonlight)")
-        title.setFont(QFont("Segoe UI", 22, QFont.Bold))
+        title.setFont(_FONT_TITLE)
         layout.addWidget(title)
 
-        if not self.moonlight.exe_path:
-            warn = QLabel("Moonlight is not configured. Go to Settings to install or set the path.")
-            warn.setStyleSheet("color: #ff6666;")
-            layout.addWidget(warn)
-            layout.addStretch()
-            return
+        # Everything is built once; _refresh_if_needed() shows the warning or the cards depending on the runner
+        self.lbl_not_configured = QLabel("Moonlight is not configured. Go to Settings to install or set the path.")
+        self.lbl_not_configured.setStyleSheet(_STYLE_ERROR)
+        layout.addWidget(self.lbl_not_configured)
 
         # Pairing Card
-        pair_card = QFrame()
+        self.pair_card = pair_card = QFrame()
         pair_card.setObjectName("card")
         pair_layout = QVBoxLayout(pair_card)
         pair_layout.setContentsMargins(16, 16, 16, 16)
         pair_layout.setSpacing(8)
 
         lbl_pair = QLabel("1. First-time pairing:")
-        lbl_pair.setFont(QFont("Segoe UI", 12, QFont.Bold))
+        lbl_pair.setFont(_FONT_CARD)
         pair_layout.addWidget(lbl_pair)
 
         lbl_pair_desc = QLabel(
@@ -279,14 +343,14 @@ class ClientScreen(QWidget):
         layout.addWidget(pair_card)
 
         # Connect Card
-        conn_card = QFrame()
+        self.conn_card = conn_card = QFrame()
         conn_card.setObjectName("card")
         conn_layout = QVBoxLayout(conn_card)
         conn_layout.setContentsMargins(16, 16, 16, 16)
         conn_layout.setSpacing(12)
 
         lbl_conn = QLabel("2. Connect:")
-        lbl_conn.setFont(QFont("Segoe UI", 12, QFont.Bold))
+        lbl_conn.setFont(_FONT_CARD)
         conn_layout.addWidget(lbl_conn)
 
         row_code = QHBoxLayout()
@@ -311,6 +375,19 @@ class ClientScreen(QWidget):
         layout.addWidget(conn_card)
         layout.addStretch()
 
+        self._refresh_if_needed()
+
+    def set_runner(self, moonlight_runner: MoonlightRunner):
+        """Swap in a new runner (after a path change) without rebuilding the screen."""
+        self.moonlight = moonlight_runner
+        self._refresh_if_needed()
+
+    def _refresh_if_needed(self):
+        configured = bool(self.moonlight.exe_path)
+        self.lbl_not_configured.setVisible(not configured)
+        self.pair_card.setVisible(configured)
+        self.conn_card.setVisible(configured)
+
     @Slot()
     def open_moonlight_gui(self):
         ok, msg = self.moonlight.open_gui()
@@ -369,7 +446,7 @@ class SettingsScreen(QWidget):
         layout.setSpacing(16)
 
         title = QLabel("Settings")
-        title.setFont(QFont("Segoe UI", 22, QFont.Bold))
+        title.setFont(_FONT_TITLE)
         layout.addWidget(title)
 
         # Sunshine Card
@@ -380,11 +457,11 @@ class SettingsScreen(QWidget):
         sun_layout.setSpacing(10)
 
         lbl_sun = QLabel("Sunshine (Host)")
-        lbl_sun.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        lbl_sun.setFont(_FONT_SECTION)
         sun_layout.addWidget(lbl_sun)
 
         self.lbl_sun_path = QLabel(self.sunshine_path or "Not configured")
-        self.lbl_sun_path.setStyleSheet("color: #bbbbbb;")
+        self.lbl_sun_path.setStyleSheet(_STYLE_PATH)
         sun_layout.addWidget(self.lbl_sun_path)
 
         row_sun_btns = QHBoxLayout()
@@ -407,8 +484,8 @@ class SettingsScreen(QWidget):
         sun_layout.addWidget(line)
         
         lbl_creds = QLabel("Headless Setup (Create/Update Login)")
-        lbl_creds.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        lbl_creds.setStyleSheet("color: #aaaaaa;")
+        lbl_creds.setFont(_FONT_SMALL_BOLD)
+        lbl_creds.setStyleSheet(_STYLE_MUTED)
         sun_layout.addWidget(lbl_creds)
         
         row_creds = QHBoxLayout()
@@ -441,11 +518,11 @@ class SettingsScreen(QWidget):
         moon_layout.setSpacing(10)
 
         lbl_moon = QLabel("Moonlight (Client)")
-        lbl_moon.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        lbl_moon.setFont(_FONT_SECTION)
         moon_layout.addWidget(lbl_moon)
 
         self.lbl_moon_path = QLabel(self.moonlight_path or "Not configured")
-        self.lbl_moon_path.setStyleSheet("color: #bbbbbb;")
+        self.lbl_moon_path.setStyleSheet(_STYLE_PATH)
         moon_layout.addWidget(self.lbl_moon_path)
 
         row_moon_btns = QHBoxLayout()
@@ -479,6 +556,8 @@ class SettingsScreen(QWidget):
     def browse_moonlight(self):
         path, _ = QFileDialog.getOpenFileName(self, "Select Moonlight Executable", "", "Executable (*.exe)")
         if path:
+            invalidate_moonlight_cache()
+
             self.moonlight_path = path
             self.config["moonlight_path"] = path
             save_config(self.config)
@@ -530,12 +609,12 @@ class SettingsScreen(QWidget):
         vbox.setAlignment(Qt.AlignCenter)
 
         title = QLabel(title_text)
-        title.setFont(QFont("Segoe UI", 18, QFont.Bold))
-        title.setStyleSheet("color: white;")
+        title.setFont(_FONT_HEADING)
+        title.setStyleSheet(_STYLE_WHITE)
         vbox.addWidget(title, alignment=Qt.AlignHCenter)
 
         self.progress_label = QLabel("Starting...")
-        self.progress_label.setStyleSheet("color: white;")
+        self.progress_label.setStyleSheet(_STYLE_WHITE)
         vbox.addWidget(self.progress_label, alignment=Qt.AlignHCenter)
 
         self.progress_bar = QProgressBar()
@@ -559,10 +638,10 @@ class SettingsScreen(QWidget):
             return
 
         self._show_install_overlay("Installing Sunshine...")
-        self.worker = InstallWorker(SunshineInstaller, target_dir)
-        self.worker.progress.connect(self._on_install_progress)
-        self.worker.finished.connect(self._on_sunshine_installed)
-        self.worker.start()
+        self.install_signals = InstallSignals()
+        self.install_signals.progress.connect(self._on_install_progress)
+        self.install_signals.finished.connect(self._on_sunshine_installed)
+        QThreadPool.globalInstance().start(InstallJob(SunshineInstaller, target_dir, self.install_signals))
 
     @Slot()
     def install_moonlight(self):
@@ -571,10 +650,10 @@ class SettingsScreen(QWidget):
             return
 
         self._show_install_overlay("Installing Moonlight...")
-        self.worker = InstallWorker(MoonlightInstaller, target_dir)
-        self.worker.progress.connect(self._on_install_progress)
-        self.worker.finished.connect(self._on_moonlight_installed)
-        self.worker.start()
+        self.install_signals = InstallSignals()
+        self.install_signals.progress.connect(self._on_install_progress)
+        self.install_signals.finished.connect(self._on_moonlight_installed)
+        QThreadPool.globalInstance().start(InstallJob(MoonlightInstaller, target_dir, self.install_signals))
 
     @Slot(str, int)
     def _on_install_progress(self, text, percent):
@@ -600,6 +679,8 @@ class SettingsScreen(QWidget):
     def _on_moonlight_installed(self, success, res):
         self._hide_install_overlay()
         if success:
+            invalidate_moonlight_cache()
+
             self.moonlight_path = res
             self.config["moonlight_path"] = res
             save_config(self.config)
@@ -614,7 +695,64 @@ class SettingsScreen(QWidget):
 # Main Window
 # =========================
 
+# OS probe done once at import instead of on every _init_palette()
+# HACK: Very rough Windows 11 check – not perfect but good enough for now.
+_SYSTEM = platform.system()
+_RELEASE = platform.release()
+IS_WIN11 = _SYSTEM == "Windows" and _RELEASE in ("10", "11")
+
+# Palette colors, built once at import rather than on every _init_palette()
+_BG_WIN11 = QColor(18, 18, 22, 230)
+_CARD_BG_WIN11 = QColor(32, 32, 38, 245)
+_CARD_ALT_WIN11 = _CARD_BG_WIN11.darker(105)
+_BG_OTHER = QColor(18, 18, 18)
+_CARD_BG_OTHER = QColor(32, 32, 32)
+_CARD_ALT_OTHER = _CARD_BG_OTHER.darker(105)
+_HIGHLIGHT = QColor(50, 120, 220)
+
+# TODO: Move this to an external .qss file so designers can tweak it without touching py code.
+_QSS = """
+    QMainWindow {
+        background-color: #121218;
+    }
+    QFrame#card {
+        background-color: rgba(32, 32, 40, 230);
+        border-radius: 12px;
+    }
+    QPushButton {
+        background-color: #2d2d35;
+        color: white;
+        border-radius: 8px;
+        padding: 6px 12px;
+    }
+    QPushButton:hover {
+        background-color: #3b3b45;
+    }
+    QPushButton#primaryButton {
+        background-color: #1f6feb;
+    }
+    QPushButton#primaryButton:hover {
+        background-color: #205fd0;
+    }
+    QPushButton:checked {
+        background-color: #1f6feb;
+        color: white;
+        border-radius: 8px;
+    }
+    QLineEdit, QComboBox {
+        background-color: #1c1c22;
+        color: white;
+        border-radius: 6px;
+        padding: 4px 8px;
+        border: 1px solid #333333;
+    }
+    """
+
+
 class MainWindow(QMainWindow):
+    # Queued over to StatusPoller.poll on the poll thread
+    status_poll_requested = Signal()
+
     def __init__(self):
         super().__init__()
 
@@ -630,6 +768,12 @@ class MainWindow(QMainWindow):
 
         self.moonlight_runner = MoonlightRunner(self.config.get("moonlight_path", None))
 
+        # Resolved once per session by IpWorker, then handed to HostScreen
+        self.local_ip = None
+        self.connection_code = None
+        # Last reported Sunshine status, so a HostScreen built later starts out correct
+        self.sunshine_running = False
+
         # If we have custom Sunshine path in config, share with manager
         sun_cfg_path = self.config.get("sunshine_path", "")
         if sun_cfg_path:
@@ -637,6 +781,7 @@ class MainWindow(QMainWindow):
 
         self._init_palette()
         self._build_layout()
+        self._start_ip_lookup()
         self._start_status_timer()
 
     def _init_palette(self):
@@ -646,67 +791,27 @@ class MainWindow(QMainWindow):
         """
         pal = self.palette()
 
-        is_win = platform.system() == "Windows"
-        # HACK: Very rough Windows 11 check – not perfect but good enough for now.
-        is_win11 = is_win and (platform.release() == "10" or platform.release() == "11")
-        is_win11 = is_win and (platform.release() == "10" or platform.release() == "11")
-
-        if is_win11:
+        if IS_WIN11:
             # Mica-like dark palette (not true OS-level Mica, but similar look)
-            bg = QColor(18, 18, 22, 230)
-            card_bg = QColor(32, 32, 38, 245)
+            bg, card_bg, card_alt = _BG_WIN11, _CARD_BG_WIN11, _CARD_ALT_WIN11
         else:
-            bg = QColor(18, 18, 18)
-            card_bg = QColor(32, 32, 32)
+            bg, card_bg, card_alt = _BG_OTHER, _CARD_BG_OTHER, _CARD_ALT_OTHER
 
         pal.setColor(QPalette.Window, bg)
         pal.setColor(QPalette.Base, card_bg)
-        pal.setColor(QPalette.AlternateBase, card_bg.darker(105))
+        pal.setColor(QPalette.AlternateBase, card_alt)
         pal.setColor(QPalette.WindowText, Qt.white)
         pal.setColor(QPalette.Text, Qt.white)
         pal.setColor(QPalette.Button, card_bg)
         pal.setColor(QPalette.ButtonText, Qt.white)
-        pal.setColor(QPalette.Highlight, QColor(50, 120, 220))
+        pal.setColor(QPalette.Highlight, _HIGHLIGHT)
         pal.setColor(QPalette.HighlightedText, Qt.white)
 
         self.setPalette(pal)
         self.setAutoFillBackground(True)
 
-        self.setAutoFillBackground(True)
-
         # Global stylesheet for modern look
-        # TODO: Move this to an external .qss file so designers can tweak it without touching py code.
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #121218;
-            }
-            QFrame#card {
-                background-color: rgba(32, 32, 40, 230);
-                border-radius: 12px;
-            }
-            QPushButton {
-                background-color: #2d2d35;
-                color: white;
-                border-radius: 8px;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #3b3b45;
-            }
-            QPushButton#primaryButton {
-                background-color: #1f6feb;
-            }
-            QPushButton#primaryButton:hover {
-                background-color: #205fd0;
-            }
-            QLineEdit, QComboBox {
-                background-color: #1c1c22;
-                color: white;
-                border-radius: 6px;
-                padding: 4px 8px;
-                border: 1px solid #333333;
-            }
-        """)
+        self.setStyleSheet(_QSS)
 
     def _build_layout(self):
         central = QWidget()
@@ -722,10 +827,10 @@ class MainWindow(QMainWindow):
         sidebar_layout.setSpacing(12)
 
         title = QLabel("GameBeam")
-        title.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        title.setFont(_FONT_HEADING)
         sidebar_layout.addWidget(title)
         subtitle = QLabel("Sunshine + Moonlight")
-        subtitle.setStyleSheet("color: #aaaaaa;")
+        subtitle.setStyleSheet(_STYLE_MUTED)
         sidebar_layout.addWidget(subtitle)
 
         sidebar_layout.addSpacing(16)
@@ -742,18 +847,19 @@ class MainWindow(QMainWindow):
         sidebar_layout.addStretch()
 
         # Central stack
+        # NOTE: Screens are only built the first time their page is opened (see _set_page),
+        # so stack indices don't match page numbers; always go through self._screens.
         self.stack = QStackedWidget()
 
-        self.host_screen = HostScreen(self, self.sunshine_api)
-        self.client_screen = ClientScreen(self, self.moonlight_runner, self.config)
-        self.settings_screen = SettingsScreen(self, self.config, self.on_paths_changed)
-        
-        # Connect credential signal
-        self.settings_screen.credentials_changed.connect(self.on_credentials_changed)
-
-        self.stack.addWidget(self.host_screen)      # index 0
-        self.stack.addWidget(self.client_screen)    # index 1
-        self.stack.addWidget(self.settings_screen)  # index 2
+        self.host_screen = None
+        self.client_screen = None
+        self.settings_screen = None
+        self._screens: dict[int, QWidget] = {}
+        self._screen_factories = {
+            0: self._create_host_screen,
+            1: self._create_client_screen,
+            2: self._create_settings_screen,
+        }
 
         root_layout.addWidget(sidebar)
         root_layout.addWidget(self.stack, 1)
@@ -767,21 +873,58 @@ class MainWindow(QMainWindow):
 
         self._set_page(0)
 
+    def _create_host_screen(self):
+        self.host_screen = HostScreen(self, self.sunshine_api, ip=self.local_ip, code=self.connection_code)
+        self.host_screen.update_status(self.sunshine_running)
+        return self.host_screen
+
+    def _create_client_screen(self):
+        self.client_screen = ClientScreen(self, self.moonlight_runner, self.config)
+        return self.client_screen
+
+    def _create_settings_screen(self):
+        self.settings_screen = SettingsScreen(self, self.config, self.on_paths_changed)
+        # Connect credential signal
+        self.settings_screen.credentials_changed.connect(self.on_credentials_changed)
+        return self.settings_screen
+
     def _set_page(self, idx: int):
-        self.stack.setCurrentIndex(idx)
+        screen = self._screens.get(idx)
+        if screen is None:
+            screen = self._screens[idx] = self._screen_factories[idx]()
+            self.stack.addWidget(screen)
+        self.stack.setCurrentWidget(screen)
+        # Active styling comes from QPushButton:checked in _QSS, no per-button stylesheet swaps
         for i, btn in enumerate((self.btn_host, self.btn_client, self.btn_settings)):
             btn.setChecked(i == idx)
-            if i == idx:
-                btn.setStyleSheet("background-color: #1f6feb; color: white; border-radius: 8px;")
-            else:
-                btn.setStyleSheet("")
     
     @Slot(str, str)
     def on_credentials_changed(self, user, pwd):
         logger.info("Credentials updated, reloading SunshineAPI auth.")
         self.sunshine_api.update_auth(user, pwd)
 
+    def _start_ip_lookup(self):
+        self.ip_worker = IpWorker(self)
+        self.ip_worker.result.connect(self._on_local_ip)
+        self.ip_worker.start()
+
+    @Slot(str)
+    def _on_local_ip(self, ip):
+        self.local_ip = ip
+        self.connection_code = encode_connection_code(ip)
+        if self.host_screen is not None:
+            self.host_screen.set_local_ip(ip, self.connection_code)
+
     def _start_status_timer(self):
+        # One poller thread for the whole session instead of a fresh worker per tick
+        self.poll_thread = QThread(self)
+        self.status_poller = StatusPoller()
+        self.status_poller.moveToThread(self.poll_thread)
+        self.status_poller.result.connect(self._on_sunshine_status)
+        self.status_poll_requested.connect(self.status_poller.poll, Qt.QueuedConnection)
+        self.poll_thread.finished.connect(self.status_poller.deleteLater)
+        self.poll_thread.start()
+
         self.status_timer = QTimer(self)
         self.status_timer.setInterval(3000)  # 3 seconds
         self.status_timer.timeout.connect(self._refresh_sunshine_status)
@@ -789,13 +932,27 @@ class MainWindow(QMainWindow):
         self._refresh_sunshine_status()
 
     def _refresh_sunshine_status(self):
-        # Prevent starting a new thread if one is already running
-        if hasattr(self, 'status_worker') and self.status_worker.isRunning():
+        # Don't pile up polls behind a slow one
+        if self.status_poller.in_flight:
             return
 
-        self.status_worker = SunshineStatusWorker(self) # Parent it to self
-        self.status_worker.result.connect(self.host_screen.update_status)
-        self.status_worker.start()
+        self.status_poller.in_flight = True
+        self.status_poll_requested.emit()
+
+    @Slot(bool)
+    def _on_sunshine_status(self, running):
+        self.sunshine_running = running
+        if self.host_screen is not None:
+            self.host_screen.update_status(running)
+
+    def closeEvent(self, event):
+        self.status_timer.stop()
+        self.poll_thread.quit()
+        self.poll_thread.wait()
+        # IpWorker is parented to us, so a lookup still stuck in getaddrinfo has to finish before we're destroyed
+        if self.ip_worker.isRunning():
+            self.ip_worker.wait()
+        super().closeEvent(event)
 
     def on_paths_changed(self):
         """
@@ -807,10 +964,6 @@ class MainWindow(QMainWindow):
             SunshineManager.set_custom_path(sun_path)
 
         self.moonlight_runner = MoonlightRunner(self.config.get("moonlight_path", None))
-        # Rebuild client screen with new runner
-        idx = self.stack.indexOf(self.client_screen)
-        if idx != -1:
-            self.stack.removeWidget(self.client_screen)
-            self.client_screen.deleteLater()
-        self.client_screen = ClientScreen(self, self.moonlight_runner, self.config)
-        self.stack.insertWidget(1, self.client_screen)
+        # Update the existing client screen in place; an unbuilt one picks the runner up from its factory
+        if self.client_screen is not None:
+            self.client_screen.set_runner(self.moonlight_runner)
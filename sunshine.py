@@ -1,13 +1,18 @@
 # // FILE: sunshine.py
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import zipfile
 import threading
 import subprocess
 import socket
+import select
+import errno
 import webbrowser
 import urllib3
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from utils import fetch_release, download_to_buffer, extract_zip, find_extracted
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +30,16 @@ class SunshineAPI:
     def __init__(self, username: str | None = None, password: str | None = None):
         self.auth = (username, password) if username and password else None
 
+        # One keep-alive TLS session per API object, so repeated calls skip the handshake
+        self._session = requests.Session()
+        self._session.verify = False  # NOTE: skipping verification because of self-signed certs
+        self._session.auth = self.auth
+        self._session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
+
     def update_auth(self, username: str, password: str) -> None:
         """Update stored HTTP Basic Auth credentials."""
         self.auth = (username, password)
+        self._session.auth = self.auth
 
     def send_pin(self, pin: str) -> tuple[bool, str]:
         """
@@ -40,13 +52,7 @@ class SunshineAPI:
         payload = {"pin": str(pin)}
 
         try:
-            resp = requests.post(
-                url,
-                json=payload,
-                auth=self.auth,
-                verify=False,  # NOTE: skipping verification because of self-signed certs
-                timeout=5,
-            )
+            resp = self._session.post(url, json=payload, timeout=5)
 
             if resp.status_code == 200:
                 logger.info(f"PIN {pin} sent successfully.")
@@ -71,6 +77,10 @@ class SunshineAPI:
 # Sunshine Installer
 # =========================
 
+# Installs run one at a time on a single shared worker; repeated clicks queue up instead of spawning threads.
+_install_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sunshine-install")
+
+
 class SunshineInstaller:
     """
     Downloads and extracts the latest portable Sunshine release from GitHub.
@@ -86,12 +96,7 @@ class SunshineInstaller:
             if progress_callback: progress_callback("Checking latest release...", 10)
             
             # 1. Get Release Info
-            resp = requests.get(SunshineInstaller.GITHUB_API_URL, timeout=10)
-            if resp.status_code != 200:
-                raise Exception(f"GitHub API Failed: {resp.status_code}")
-            
-            data = resp.json()
-            assets = data.get("assets", [])
+            assets = fetch_release(SunshineInstaller.GITHUB_API_URL)["assets"]
             download_url = None
             for asset in assets:
                 name = asset["name"].lower()
@@ -116,37 +121,15 @@ class SunshineInstaller:
             if not os.path.exists(target_dir):
                 os.makedirs(target_dir)
                 
-            local_zip = os.path.join(target_dir, "sunshine.zip")
-            
-            with requests.get(download_url, stream=True) as r:
-                r.raise_for_status()
-                total_length = r.headers.get('content-length')
-                dl = 0
-                with open(local_zip, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192): 
-                        if chunk: 
-                            dl += len(chunk)
-                            f.write(chunk)
-                            if total_length and progress_callback:
-                                percent = 30 + int((dl / int(total_length)) * 40) # 30 to 70
-                                progress_callback("Downloading...", percent)
-
-            # 3. Extract
-            if progress_callback: progress_callback("Extracting...", 80)
-            
-            with zipfile.ZipFile(local_zip, 'r') as zip_ref:
-                zip_ref.extractall(target_dir)
-            
-            try:
-                os.remove(local_zip)
-            except: pass
-            
-            # Find the exe
-            exe_path = None
-            for root, dirs, files in os.walk(target_dir):
-                if "sunshine.exe" in files:
-                    exe_path = os.path.join(root, "sunshine.exe")
-                    break
+            # Downloaded into memory or a temp file, so there's no sunshine.zip to write, re-read and delete
+            with download_to_buffer(download_url, progress_callback) as buf:
+                # 3. Extract
+                if progress_callback: progress_callback("Extracting...", 80)
+
+                with zipfile.ZipFile(buf, 'r') as zip_ref:
+                    members = extract_zip(zip_ref, target_dir, progress_callback)
+
+            exe_path = find_extracted(members, "sunshine.exe")
             
             if progress_callback: progress_callback("Done!", 100)
             return True, exe_path
@@ -157,13 +140,14 @@ class SunshineInstaller:
 
     @staticmethod
     def start_install_thread(target_dir, callback, on_complete):
-        def _run():
-            success, res = SunshineInstaller.install(target_dir, callback)
-            if success:
-                on_complete(True, res) # res is exe_path
-            else:
-                on_complete(False, res) # res is error msg
-        threading.Thread(target=_run, daemon=True).start()
+        """
+        Runs install() in the background and calls on_complete(success, exe_path_or_error) when done.
+        Returns the Future, so callers can cancel an install that hasn't started yet.
+        """
+        fut = _install_executor.submit(SunshineInstaller.install, target_dir, callback)
+        # install() catches its own errors, so result() is always the (success, res) tuple
+        fut.add_done_callback(lambda f: on_complete(*f.result()) if not f.cancelled() else None)
+        return fut
 
 
 # =========================
@@ -182,17 +166,27 @@ class SunshineManager:
     DEFAULT_WEB_UI = "https://localhost:47990"
 
     # System paths fallback
-    SYSTEM_PATHS = [
+    SYSTEM_PATHS = (
         r"C:\Program Files\Sunshine\sunshine.exe",
         r"C:\Program Files (x86)\Sunshine\sunshine.exe",
         r"C:\Sunshine\sunshine.exe",
-    ]
+    )
 
     _custom_path: str | None = None
 
+    # Last successful executable lookup, reused until set_custom_path() changes the inputs.
+    # Misses aren't cached, so a Sunshine installed behind our back is picked up on the next call.
+    # NOTE: Locked because installs run on a worker thread while the GUI thread also resolves the exe.
+    _cached_exe: str | None = None
+    _cache_valid: bool = False
+    _cache_lock = threading.Lock()
+
     @staticmethod
     def set_custom_path(path: str) -> None:
         """Sets a user-defined path for the Sunshine executable."""
+        with SunshineManager._cache_lock:
+            SunshineManager._cache_valid = False
+
         if path and os.path.exists(path):
             logger.info(f"Using custom Sunshine path: {path}")
             SunshineManager._custom_path = path
@@ -201,7 +195,20 @@ class SunshineManager:
 
     @staticmethod
     def _find_executable() -> str | None:
-        """Return the best guess for sunshine.exe, or None if not found."""
+        """Return the best guess for sunshine.exe, or None if not found (hits are cached)."""
+        with SunshineManager._cache_lock:
+            if SunshineManager._cache_valid:
+                return SunshineManager._cached_exe
+
+            exe = SunshineManager._scan_executable()
+            if exe:
+                SunshineManager._cached_exe = exe
+                SunshineManager._cache_valid = True
+            return exe
+
+    @staticmethod
+    def _scan_executable() -> str | None:
+        """Uncached lookup: custom path first, then the known system locations."""
         # 1. Custom Path
         if SunshineManager._custom_path and os.path.exists(SunshineManager._custom_path):
             return SunshineManager._custom_path
@@ -219,11 +226,23 @@ class SunshineManager:
     def is_running(host: str = "localhost", port: int = 47990) -> bool:
         """
         Checks if Sunshine's web/API endpoint is reachable.
+        Non-blocking connect: a refused port answers immediately instead of eating a 1s timeout.
         """
         try:
-            with socket.create_connection((host, port), timeout=1):
-                return True
-        except (socket.timeout, ConnectionRefusedError, OSError):
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                s.setblocking(False)
+                err = s.connect_ex((host, port))
+                if err in (0, errno.EISCONN):
+                    return True
+                if err not in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY):
+                    return False
+
+                # NOTE: Windows reports a failed connect through the except set, not the write set
+                _, writable, failed = select.select([], [s], [s], 0.2)
+                if failed or not writable:
+                    return False
+                return s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+        except OSError:
             return False
 
     @staticmethod
@@ -261,19 +280,28 @@ class SunshineManager:
             safe_cmd_repr = " ".join([exe, "--creds", username, "********"])
             logger.info(f"Initializing Sunshine credentials via: {safe_cmd_repr}")
 
-            proc = subprocess.run(
+            # Only stderr is ever read, so stdout goes straight to DEVNULL instead of a pipe
+            proc = subprocess.Popen(
                 cmd,
                 cwd=os.path.dirname(exe),
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 shell=False,
             )
+            try:
+                _, err = proc.communicate(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.communicate()
+                logger.error("Sunshine --creds timed out.")
+                return False, "Sunshine did not finish setting credentials in time."
 
             if proc.returncode != 0:
                 logger.error(
-                    f"Sunshine --creds failed (code {proc.returncode}): {proc.stderr}"
+                    f"Sunshine --creds failed (code {proc.returncode}): {err}"
                 )
-                msg = proc.stderr.strip() or "Failed to set credentials."
+                msg = err.strip() or "Failed to set credentials."
                 return False, msg
 
             logger.info("Sunshine credentials initialized successfully.")
@@ -298,10 +326,16 @@ class SunshineManager:
 
         try:
             logger.info(f"Starting Sunshine: {path}")
+            # Spawn sunshine.exe directly (no cmd.exe in between) and detach it from our console/session
+            if os.name == "nt":
+                detach = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+            else:
+                detach = {"start_new_session": True}
             subprocess.Popen(
                 [path],
                 cwd=os.path.dirname(path),
-                shell=True,  # fine on Windows, starts detached
+                close_fds=True,
+                **detach,
             )
             return True, "Service Started"
         except Exception as e:
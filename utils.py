@@ -1,12 +1,43 @@
 # // FILE: utils.py
+import io
+import os
+import re
+import shutil
 import socket
 import ctypes
 import sys
+import time
 import base64
+import functools
 import json
 import binascii
+import threading
+import tempfile
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from logger_config import logger
 
+COPY_BUFSIZE = 1 << 20
+SPOOL_MAX_SIZE = 64 << 20
+# Below this, thread pool setup costs more than it saves
+PARALLEL_EXTRACT_MIN = 4 << 20
+
+GITHUB_API_HEADERS = {"Accept": "application/vnd.github+json"}
+
+# NOTE: One pooled session shared by both installers, so release lookups and asset downloads reuse keep-alive connections.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers["User-Agent"] = "GameBeam"
+HTTP_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=3, backoff_factor=0.3)),
+)
+
+# NOTE: Release lookups are cached on disk with their ETag, keyed by API URL. A 304 doesn't count against GitHub's 60/hr anonymous limit.
+RELEASE_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".gamebeam", "release_cache.json")
+_MAX_AGE_RE = re.compile(r"(?:^|[,\s])max-age=(\d+)")
+
 def encode_connection_code(ip):
     """
     # NOTE: Not encryption, just obfuscation so users don't freak out about sharing raw IPs.
@@ -14,48 +45,82 @@ def encode_connection_code(ip):
     Format: GSP-[Base64]
     """
     try:
-        # TODO: Add version byte? Overkill for now.
-        b64 = base64.urlsafe_b64encode(ip.encode("utf-8")).decode("ascii").rstrip("=")
-        return f"GSP-{b64}"
+        return _encode_connection_code(ip)
     except Exception:
         return "ERROR"
 
+# NOTE: The cached helpers raise on bad input instead of returning a sentinel,
+# so failures never end up in the cache. The public wrappers handle that.
+@functools.lru_cache(maxsize=16)
+def _encode_connection_code(ip):
+    # TODO: Add version byte? Overkill for now.
+    b64 = base64.urlsafe_b64encode(ip.encode("utf-8")).decode("ascii").rstrip("=")
+    return f"GSP-{b64}"
+
 def decode_connection_code(code):
     """
     Decodes GSP-XXXX back to an IP address.
     """
     try:
-        code = code.strip()
-        if code.startswith("GSP-"):
-            code = code[4:]
-        
-        # Add padding back if missing
-        pad = len(code) % 4
-        if pad > 0:
-            code += "=" * (4 - pad)
-            
-        ip = base64.urlsafe_b64decode(code).decode("utf-8")
-        # TODO: Regex validate 'ip' to ensure it's actually an IP address
-        return ip
+        # Normalized before the cache lookup so " GSP-x " and "GSP-x" share an entry
+        return _decode_connection_code(code.strip())
     except Exception:
         return None
 
+@functools.lru_cache(maxsize=16)
+def _decode_connection_code(code):
+    # Work on bytes directly, urlsafe_b64decode would encode a str anyway
+    b = code.encode("ascii")
+    if b[:4] == b"GSP-":
+        b = b[4:]
+    
+    # Add padding back if missing
+    pad = -len(b) % 4
+    if pad:
+        b += b"=" * pad
+        
+    ip = base64.urlsafe_b64decode(b).decode("utf-8")
+    # TODO: Regex validate 'ip' to ensure it's actually an IP address
+    return ip
+
+# First usable (non-loopback) LAN IP, kept for the process lifetime.
+_cached_local_ip: str | None = None
+
 def get_local_ip():
+    """
+    Returns the machine's LAN IP, detecting it on first use only.
+    A loopback fallback isn't cached, so a later call can still find a real address.
+    """
+    global _cached_local_ip
+    if _cached_local_ip is not None:
+        return _cached_local_ip
+
+    ip = _detect_local_ip()
+    if not ip.startswith("127."):
+        _cached_local_ip = ip
+    return ip
+
+def _detect_local_ip():
     """
     Attempts to retrieve the local IP address of the machine.
     # TODO: This UDP trick is clever but verify it works heavily restricted VPNs.
     Prioritizes the 'UDP Connect Trick'.
     """
+    ip = None
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-        if not ip.startswith("127."):
-            return ip
+        try:
+            s.connect(("8.8.8.8", 80))
+            ip = s.getsockname()[0]
+        finally:
+            s.close()
     except Exception:
         pass
 
+    if ip and not ip.startswith("127."):
+        return ip
+
+    # UDP trick failed or only gave us loopback, ask the resolver instead
     try:
         hostname = socket.gethostname()
         addrinfo = socket.getaddrinfo(hostname, None, family=socket.AF_INET)
@@ -68,6 +133,166 @@ def get_local_ip():
 
     return "127.0.0.1"
 
+def _load_release_cache():
+    try:
+        with open(RELEASE_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_release_cache(cache):
+    try:
+        os.makedirs(os.path.dirname(RELEASE_CACHE_FILE), exist_ok=True)
+        with open(RELEASE_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        logger.warning(f"Failed to save release cache: {e}")
+
+def fetch_release(url):
+    """
+    Returns the GitHub release JSON for `url` (only the asset names/URLs are kept).
+    Fresh cache entries (per Cache-Control max-age) skip the request, stale ones are revalidated with If-None-Match.
+    """
+    cache = _load_release_cache()
+    entry = cache.get(url)
+    headers = dict(GITHUB_API_HEADERS)
+    if entry:
+        if time.time() < entry.get("expires", 0):
+            return entry["data"]
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+
+    resp = HTTP_SESSION.get(url, headers=headers, timeout=10)
+    if resp.status_code == 304 and entry:
+        data = entry["data"]
+    elif resp.status_code == 200:
+        assets = resp.json().get("assets", [])
+        data = {"assets": [{"name": a["name"], "browser_download_url": a["browser_download_url"]} for a in assets]}
+    else:
+        raise Exception(f"GitHub API Failed: {resp.status_code}")
+
+    m = _MAX_AGE_RE.search(resp.headers.get("Cache-Control", ""))
+    cache[url] = {
+        "etag": resp.headers.get("ETag") or (entry or {}).get("etag"),
+        "expires": time.time() + (int(m.group(1)) if m else 0),
+        "data": data,
+    }
+    _save_release_cache(cache)
+    return data
+
+def _download_buffer(total):
+    """
+    Returns an empty seekable buffer for a download of `total` bytes (0 if unknown).
+    Small releases stay in RAM, bigger or unknown-size ones go straight to a temp file.
+    """
+    # NOTE: Not SpooledTemporaryFile: before 3.11 it has no seekable(), and zipfile needs that to open members.
+    if total and total <= SPOOL_MAX_SIZE:
+        return io.BytesIO()
+    return tempfile.TemporaryFile()
+
+def download_to_buffer(url, progress_callback=None, lo=30, hi=70):
+    """
+    Streams `url` into memory or a temp file and returns the buffer rewound, ready for zipfile.
+    Progress is reported as "Downloading..." from `lo` to `hi` percent. The caller closes the buffer.
+    """
+    with HTTP_SESSION.get(url, stream=True, timeout=30) as r:
+        r.raise_for_status()
+        total_length = r.headers.get('content-length')
+        total = int(total_length) if total_length else 0
+        buf = _download_buffer(total)
+        try:
+            if total > SPOOL_MAX_SIZE:
+                # On disk anyway: reserve the full size up front so the temp file isn't grown chunk by chunk
+                buf.truncate(total)
+            # Precomputed so the loop body is one multiply per chunk
+            scale = ((hi - lo) / total) if total and progress_callback else 0.0
+            dl = 0
+            last_percent = -1
+            for chunk in r.iter_content(chunk_size=COPY_BUFSIZE):
+                if chunk:
+                    dl += len(chunk)
+                    buf.write(chunk)
+                    if scale:
+                        percent = lo + int(dl * scale)
+                        # Only report whole-percent changes, no point spamming the UI thread
+                        if percent != last_percent:
+                            last_percent = percent
+                            progress_callback("Downloading...", percent)
+            # Drop any preallocated tail we didn't fill, the zip directory has to be at the real end
+            buf.truncate()
+        except Exception:
+            buf.close()
+            raise
+
+    buf.seek(0)
+    return buf
+
+def _member_dest(root, info):
+    """Resolves where an archive member lands under `root`, refusing zip-slip entries."""
+    dest = os.path.realpath(os.path.join(root, info.filename))
+    # NOTE: extractall() used to sanitize paths for us, so we have to refuse zip-slip entries ourselves.
+    if dest != root and not dest.startswith(root + os.sep):
+        raise Exception(f"Unsafe path in archive: {info.filename}")
+    return dest
+
+def extract_zip(zip_ref, target_dir, progress_callback=None):
+    """
+    Extracts an open ZipFile into `target_dir`, copying members concurrently on a thread pool.
+    Small archives are copied inline. Progress is reported in the 80-99 range.
+    Returns a list of (ZipInfo, destination path) pairs.
+    """
+    root = os.path.realpath(target_dir)
+    members = [(zi, _member_dest(root, zi)) for zi in zip_ref.infolist()]
+
+    # Build the directory tree up front so workers never race each other on makedirs
+    dirs = {dest if zi.is_dir() else os.path.dirname(dest) for zi, dest in members}
+    for d in sorted(dirs):
+        os.makedirs(d, exist_ok=True)
+
+    files = [(zi, dest) for zi, dest in members if not zi.is_dir()]
+    total_size = sum(zi.file_size for zi, _ in files) or 1
+    done = 0
+    lock = threading.Lock()
+
+    def _extract_one(item):
+        nonlocal done
+        zi, dest = item
+        # NOTE: Sharing zip_ref is fine, ZipFile serializes the raw seek+read internally
+        # and the inflate itself runs outside that lock.
+        if zi.file_size < COPY_BUFSIZE:
+            # Most members are tiny translations/plugins: one read, one write, no copy loop
+            data = zip_ref.read(zi)
+            with open(dest, 'wb') as dst:
+                dst.write(data)
+        else:
+            with zip_ref.open(zi) as src, open(dest, 'wb') as dst:
+                shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+
+        with lock:
+            done += zi.file_size
+            if progress_callback:
+                progress_callback("Extracting...", 80 + int((done / total_size) * 19))
+
+    if sum(zi.compress_size for zi, _ in files) < PARALLEL_EXTRACT_MIN:
+        for item in files:
+            _extract_one(item)
+    else:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            # list() so the first worker exception propagates here
+            list(pool.map(_extract_one, files))
+
+    return members
+
+def find_extracted(members, name):
+    """Returns where the first file called `name` (case-insensitive) from extract_zip()'s result landed, or None."""
+    # We know every destination from the archive listing, no need to walk the tree afterwards
+    name = name.lower()
+    return next(
+        (dest for zi, dest in members
+         if not zi.is_dir() and os.path.basename(zi.filename).lower() == name),
+        None,
+    )
+
 def is_admin():
     try:
         return ctypes.windll.shell32.IsUserAnAdmin()